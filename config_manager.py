@@ -1,4 +1,4 @@
-import json, os
+import json, os, threading
 
 CONFIG_FILE = "user_config.json"
 
@@ -11,6 +11,28 @@ def load_config():
             return {}
     return {}
 
-def save_config(config: dict):
-    with open(CONFIG_FILE, "w") as f:
+_lock = threading.Lock()
+
+def _write(config: dict):
+    # temp file + os.replace: readers never see a half-written config
+    tmp = CONFIG_FILE + ".tmp"
+    with open(tmp, "w") as f:
         json.dump(config, f, indent=2)
+    os.replace(tmp, CONFIG_FILE)
+
+def save_config(config: dict):
+    with _lock:
+        _write(config)
+
+def update_config(merge=None, **entries):
+    """Load, merge top-level entries and save in one step (safe from worker threads).
+       merge: {key: dict} folded into the dict already stored under key, so
+       fields another writer put there are kept.
+    """
+    with _lock:
+        cfg = load_config()
+        cfg.update(entries)
+        for key, fields in (merge or {}).items():
+            current = cfg.get(key)
+            cfg[key] = {**(current if isinstance(current, dict) else {}), **fields}
+        _write(cfg)
@@ -0,0 +1,389 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; NumPy implementations are used instead
+    njit = None
+
+try:
+    from tsdownsample import M4Downsampler, MinMaxLTTBDownsampler
+except ImportError:  # tsdownsample is optional; m4/minmaxlttb fall back to NumPy/numba
+    M4Downsampler = MinMaxLTTBDownsampler = None
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; plain NumPy masks are used instead
+    ne = None
+
+
+def _as_float(y):
+    """y as a float array, keeping float32 as-is (no upcast copy per call)."""
+    y = np.asarray(y)
+    return y if y.dtype in (np.float32, np.float64) else y.astype(np.float64)
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets: pick n_out sample indices that keep the
+    visual shape of y(x). First and last points are always kept; every bucket
+    in between contributes the point forming the largest triangle with the
+    previously kept point and the average of the next bucket.
+    NaNs are never picked unless a bucket holds nothing else.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = _as_float(y)
+    if _lttb_jit is not None:
+        return _lttb_jit(x, y, n_out)
+
+    every = (n - 2) / (n_out - 2)
+    edges = (np.arange(n_out - 1) * every).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = hi, (edges[i + 2] if i + 2 < len(edges) else n)
+
+        seg_y = y[nlo:nhi]
+        ok = ~np.isnan(seg_y)
+        avg_x = x[nlo:nhi][ok].mean() if ok.any() else x[nlo]
+        avg_y = seg_y[ok].mean() if ok.any() else y[a]
+
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        area = np.where(np.isnan(area), -np.inf, area)
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
+
+
+def minmax_indices(y, n_buckets):
+    """
+    M4-style min/max decimation: split y into n_buckets equal-count buckets
+    (via reshape) and keep each bucket's min and max sample, plus the first
+    and last points. Buckets containing NaNs also keep one NaN so line breaks
+    (gap markers) survive decimation. Returns sorted int64 indices.
+    """
+    y = _as_float(y)
+    n = len(y)
+    if n_buckets < 1 or n <= 4 * n_buckets:
+        return np.arange(n)
+    if _minmax_jit is not None:
+        return _minmax_jit(y, n_buckets)
+
+    size = -(-n // n_buckets)
+    rows = -(-n // size)
+    padded = np.full(rows * size, np.nan, dtype=y.dtype)
+    padded[:n] = y
+    block = padded.reshape(rows, size)
+
+    nan = np.isnan(block)
+    offsets = np.arange(rows, dtype=np.int64) * size
+    i_min = offsets + np.argmin(_nan_filled(block, nan, np.inf), axis=1)
+    i_max = offsets + np.argmax(_nan_filled(block, nan, -np.inf), axis=1)
+    i_nan = (offsets + np.argmax(nan, axis=1))[nan.any(axis=1)]
+
+    out = np.unique(np.concatenate([[0, n - 1], i_min, i_max, i_nan]))
+    return out[out < n]
+
+
+def m4_indices(x, y, n_buckets):
+    """
+    M4: split the x *range* into n_buckets equal-width buckets (one per pixel
+    column) and keep each bucket's first, last, min and max sample. At that
+    width the line looks the same as the full data, with at most 4 * n_buckets
+    points. Buckets containing NaNs also keep one NaN so gap breaks survive.
+    Returns sorted int64 indices.
+    """
+    y = _as_float(y)
+    n = len(y)
+    if n_buckets < 1 or n <= 4 * n_buckets:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    if not x[-1] > x[0]:
+        return minmax_indices(y, n_buckets)
+
+    nan = np.isnan(y)
+    if M4Downsampler is not None and not nan.any():
+        idx = M4Downsampler().downsample(x, y, n_out=4 * n_buckets)
+        return np.asarray(idx, dtype=np.int64)
+    if _m4_jit is not None:
+        return _m4_jit(x, y, n_buckets)
+
+    bucket = ((x - x[0]) * (n_buckets / (x[-1] - x[0]))).astype(np.int64)
+    np.minimum(bucket, n_buckets - 1, out=bucket)
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(bucket)) + 1])
+    seg = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+
+    lo = _nan_filled(y, nan, np.inf)
+    hi = _nan_filled(y, nan, -np.inf)
+    i_min = _first_per_segment(np.flatnonzero(lo == np.minimum.reduceat(lo, starts)[seg]), seg)
+    i_max = _first_per_segment(np.flatnonzero(hi == np.maximum.reduceat(hi, starts)[seg]), seg)
+    i_nan = _first_per_segment(np.flatnonzero(nan), seg)
+
+    return np.unique(np.concatenate([starts, np.append(starts[1:], n) - 1, i_min, i_max, i_nan]))
+
+
+def _first_per_segment(idx, seg):
+    """From sorted indices idx, keep the first one falling in each segment."""
+    s = seg[idx]
+    keep = np.ones(len(s), dtype=bool)
+    keep[1:] = s[1:] != s[:-1]
+    return idx[keep]
+
+
+def minmaxlttb_indices(x, y, n_out, minmax_ratio=4):
+    """
+    MinMaxLTTB: min/max-preselect ~minmax_ratio * n_out candidates, then run
+    LTTB on those. Keeps LTTB's shape fidelity at close to min/max cost.
+    Uses tsdownsample (Rust/SIMD) when installed and y has no NaNs; otherwise
+    the local min/max + LTTB, re-adding the NaN gap markers LTTB would skip.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    y = _as_float(y)
+    nan = np.isnan(y)
+    if MinMaxLTTBDownsampler is not None and not nan.any():
+        idx = MinMaxLTTBDownsampler().downsample(
+            np.asarray(x, dtype=np.float64), y, n_out=n_out, minmax_ratio=minmax_ratio
+        )
+        return np.asarray(idx, dtype=np.int64)
+
+    pre = minmax_indices(y, max(n_out * minmax_ratio // 2, 1))
+    keep = pre[lttb_indices(np.asarray(x, dtype=np.float64)[pre], y[pre], n_out)]
+    if nan.any():
+        keep = np.union1d(keep, pre[nan[pre]])
+    return keep
+
+
+def gap_indices(t, threshold):
+    """
+    Indices i where t[i] - t[i-1] > threshold, for sorted int64 timestamps
+    (e.g. datetime64[ns] viewed as int64). Pairs involving NaT never count.
+    """
+    t = np.asarray(t, dtype=np.int64)
+    if _gaps_jit is not None:
+        return _gaps_jit(t, threshold)
+    ok = (t[1:] != _NAT) & (t[:-1] != _NAT)
+    return np.flatnonzero(ok & (t[1:] - t[:-1] > threshold)) + 1
+
+
+_NAT = np.iinfo(np.int64).min
+
+# Perf knob registry: name -> f(x, y, n_out) returning sorted int64 indices
+DOWNSAMPLERS = {
+    # callers ask for ~2 points per pixel column, i.e. n_out // 2 pixel buckets for M4
+    "m4": lambda x, y, n_out: m4_indices(x, y, n_out // 2),
+    "minmax": lambda x, y, n_out: minmax_indices(y, n_out // 2),
+    "lttb": lttb_indices,
+    "minmaxlttb": minmaxlttb_indices,
+}
+
+
+def _nan_filled(block, nan, fill):
+    """block with NaNs replaced by fill; one fused, multi-threaded pass with numexpr."""
+    if ne is not None:
+        return ne.evaluate("where(block != block, fill, block)", local_dict={"block": block, "fill": fill})
+    return np.where(nan, fill, block)
+
+
+# -------------------------------
+# Compiled kernels (numba)
+# -------------------------------
+# Plain loops mirroring the NumPy versions above. No fastmath: it would let
+# the compiler assume no NaNs, and NaNs are what break lines at time gaps.
+def _lttb_loop(x, y, n_out):
+    n = x.shape[0]
+    every = (n - 2) / (n_out - 2)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[n_out - 1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo = int(i * every) + 1
+        hi = n - 1 if i + 1 == n_out - 2 else int((i + 1) * every) + 1
+        nlo = hi
+        if i + 2 < n_out - 2:
+            nhi = int((i + 2) * every) + 1
+        elif i + 2 == n_out - 2:
+            nhi = n - 1
+        else:
+            nhi = n
+
+        sx = 0.0
+        sy = 0.0
+        cnt = 0
+        for j in range(nlo, nhi):
+            if y[j] == y[j]:
+                sx += x[j]
+                sy += y[j]
+                cnt += 1
+        if cnt > 0:
+            avg_x = sx / cnt
+            avg_y = sy / cnt
+        else:
+            avg_x = x[nlo]
+            avg_y = y[a]
+
+        best = lo
+        best_area = -np.inf
+        for j in range(lo, hi):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best_area = area
+                best = j
+        a = best
+        out[i + 1] = a
+    return out
+
+
+def _minmax_loop(y, n_buckets):
+    n = y.shape[0]
+    size = (n + n_buckets - 1) // n_buckets
+    out = np.empty(5 * ((n + size - 1) // size), dtype=np.int64)
+    cand = np.empty(5, dtype=np.int64)
+    k = 0
+    for lo in range(0, n, size):
+        hi = min(lo + size, n)
+        imin = lo
+        imax = lo
+        inan = -1
+        vmin = np.inf
+        vmax = -np.inf
+        for i in range(lo, hi):
+            v = y[i]
+            if v != v:
+                if inan < 0:
+                    inan = i
+                continue
+            if v < vmin:
+                vmin = v
+                imin = i
+            if v > vmax:
+                vmax = v
+                imax = i
+
+        m = 0
+        if lo == 0:
+            cand[m] = 0
+            m += 1
+        cand[m] = imin
+        cand[m + 1] = imax
+        m += 2
+        if inan >= 0:
+            cand[m] = inan
+            m += 1
+        if hi == n:
+            cand[m] = n - 1
+            m += 1
+
+        # tiny insertion sort + dedupe; buckets are already in order
+        for p in range(1, m):
+            c = cand[p]
+            q = p - 1
+            while q >= 0 and cand[q] > c:
+                cand[q + 1] = cand[q]
+                q -= 1
+            cand[q + 1] = c
+        for p in range(m):
+            if k == 0 or out[k - 1] != cand[p]:
+                out[k] = cand[p]
+                k += 1
+    return out[:k]
+
+
+def _m4_loop(x, y, n_buckets):
+    n = x.shape[0]
+    x0 = x[0]
+    scale = n_buckets / (x[n - 1] - x0)
+    out = np.empty(5 * n_buckets, dtype=np.int64)
+    cand = np.empty(5, dtype=np.int64)
+    k = 0
+    lo = 0
+    while lo < n:
+        b = min(int((x[lo] - x0) * scale), n_buckets - 1)
+        hi = lo + 1
+        while hi < n and min(int((x[hi] - x0) * scale), n_buckets - 1) == b:
+            hi += 1
+
+        imin = -1
+        imax = -1
+        inan = -1
+        vmin = np.inf
+        vmax = -np.inf
+        for i in range(lo, hi):
+            v = y[i]
+            if v != v:
+                if inan < 0:
+                    inan = i
+                continue
+            if v < vmin:
+                vmin = v
+                imin = i
+            if v > vmax:
+                vmax = v
+                imax = i
+
+        cand[0] = lo
+        m = 1
+        for c in (imin, imax, inan, hi - 1):
+            if c >= 0:
+                cand[m] = c
+                m += 1
+        # tiny insertion sort + dedupe; buckets are already in order
+        for p in range(1, m):
+            c = cand[p]
+            q = p - 1
+            while q >= 0 and cand[q] > c:
+                cand[q + 1] = cand[q]
+                q -= 1
+            cand[q + 1] = c
+        for p in range(m):
+            if k == 0 or out[k - 1] != cand[p]:
+                out[k] = cand[p]
+                k += 1
+        lo = hi
+    return out[:k]
+
+
+def _gaps_loop(t, threshold):
+    nat = -9223372036854775808
+    out = np.empty(t.shape[0], dtype=np.int64)
+    k = 0
+    for i in range(1, t.shape[0]):
+        a = t[i - 1]
+        b = t[i]
+        if a != nat and b != nat and b - a > threshold:
+            out[k] = i
+            k += 1
+    return out[:k]
+
+
+_lttb_jit = _minmax_jit = _m4_jit = _gaps_jit = None
+if njit is not None:
+    try:
+        _lttb_jit = njit(cache=True)(_lttb_loop)
+        _minmax_jit = njit(cache=True)(_minmax_loop)
+        _m4_jit = njit(cache=True)(_m4_loop)
+        _gaps_jit = njit(cache=True)(_gaps_loop)
+        # warm-compile once so the first pan/zoom doesn't pay for it; y is
+        # float32 like the plot's column arrays, x float64 date numbers
+        y32 = np.arange(8, dtype=np.float32)
+        _lttb_jit(np.arange(8.0), y32, 4)
+        _minmax_jit(y32, 2)
+        _m4_jit(np.arange(8.0), y32, 2)
+        _gaps_jit(np.arange(8, dtype=np.int64), 1)
+    except Exception as e:
+        print(f"[Downsample] numba unavailable, using NumPy: {e}")
+        _lttb_jit = _minmax_jit = _m4_jit = _gaps_jit = None
+
+# M4 keeps every pixel column's extremes and vectorizes well without a compiler
+DEFAULT_DOWNSAMPLER = "m4"
@@ -15,6 +15,19 @@ import numpy as np
 from user_search import UserSearchWindow
 from tkinter import filedialog, messagebox
 
+
+def _table_rows(arr, pad=0):
+    """List-of-lists rows for tksheet (it only takes real lists) from a 2D ndarray,
+       with `pad` blank cells appended for selected columns missing from df.
+    """
+    rows = arr.tolist()
+    if pad:
+        blanks = [""] * pad
+        for r in rows:
+            r.extend(blanks)
+    return rows
+
+
 class MetricsApp:
     def __init__(self):
         ctk.set_appearance_mode("dark")
@@ -30,20 +43,27 @@ class MetricsApp:
         self.enable_table = True  # turn to False to skip tksheet
         self.query_running = False  # 🚦 prevents multiple runs
         self._timer_after_id = None
+        self._col_change_after_id = None  # pending debounced on_column_change
         self._last_cache_signature = None
         self.plot_manager = None
         self.threads = []
-        self.after_ids = []
+        self.after_ids = set()  # pending safe_after ids only; pruned as callbacks run
+        self._after_lock = threading.Lock()  # after_ids is touched from worker threads too
         self.is_closing = False
+        self._last_ts = (-1, "")  # (epoch second, "%H:%M:%S") cache for log()
         self.query_start_time = None
         self.timer_running = False
         self.table_dragging = False
         self.table_drag_start = None
         self.table_panning = False
         self.table_pan_start = None
-        self._table_order = []  # current row order (list of row indices)
+        self._table_order = np.empty(0, dtype=np.int64)  # current row order (int64 row positions)
         self._sorting = False  # debounce flag
         self._sort_dir = {}  # per-column toggle (True=asc, False=desc)
+        self._visible_col_idx_map = []  # visible sheet column -> df column position
+        self._last_compose = None  # last table matrix + the row order it was built for
+        self._table_update_gen = 0  # bumps per background table update; stale results are dropped
+        self._sort_cache = {}  # col -> dense sort rank of every df row; replaced (not cleared) with self.df
         self._last_cell = (0, 0)
         # Master color map
         self.color_map = {
@@ -180,8 +200,7 @@ class MetricsApp:
             # in-memory dataset signature
             return (
                 "meta",
-                pd.to_datetime(df["updated_at"]).min().isoformat(),
-                pd.to_datetime(df["updated_at"]).max().isoformat(),
+                *self.plot_manager.time_range(df),
                 tuple(self.get_selected_table_columns() or list(df.columns)),
             )
         # on-disk cache signature -> from meta.json, not mtime
@@ -198,12 +217,11 @@ class MetricsApp:
     def _cancel_all_afters_shutdown(self):
         """Cancel every pending Tk 'after' job just before destroying the root."""
         # 1) cancel our tracked jobs
-        for aid in list(self.after_ids):
+        for aid in self._take_after_ids():
             try:
                 self.root.after_cancel(aid)
             except Exception:
                 pass
-        self.after_ids.clear()
 
         # 2) cancel the timer loop if running
         if getattr(self, "_timer_after_id", None):
@@ -522,12 +540,10 @@ class MetricsApp:
                 "window_state": state,
             }
 
-            # --- add plot state ---
+            # --- add plot state (merged: keeps the cache writer's col_states/time_range) ---
+            merge = {}
             if self.plot_manager and self.plot_manager.ax:
-                cfg["plot_state"] = {
-                    "xlim": list(self.plot_manager.ax.get_xlim()),
-                    "ylim": list(self.plot_manager.ax.get_ylim()),
-                }
+                merge["plot_state"] = self.plot_manager.view_state()
 
             if state == "normal":
                 cfg["window_size"] = self.root.geometry()
@@ -537,7 +553,8 @@ class MetricsApp:
                 "log": getattr(self, "log_section", None).get_state() if hasattr(self, "log_section") else "expanded",
             }
 
-            config_manager.save_config(cfg)
+            # One locked read-modify-write, so concurrent writers don't lose keys
+            config_manager.update_config(merge=merge, **cfg)
             self._saved_col_states = cfg["col_states"]
 
         except Exception as e:
@@ -610,7 +627,7 @@ class MetricsApp:
         self.ranges_btn.pack(side="left", padx=10)
 
         # Disable if no cache exists
-        if not (os.path.exists(self.plot_manager.cache_file) and os.path.exists(self.plot_manager.meta_file)):
+        if not (self.plot_manager.cache_path() and os.path.exists(self.plot_manager.meta_file)):
             self.cache_btn.configure(state="disabled")
 
         # ⏱ Timer label
@@ -683,14 +700,18 @@ class MetricsApp:
                 self.show_table(df, self._saved_col_states)
 
             if self.enable_plot:
+                # plot_state is written by the cache writer after startup → read it fresh
+                plot_state = config_manager.load_config().get("plot_state") or self.config.get("plot_state", {})
+
                 sel = [c for c, checked in self._saved_col_states.items() if checked and c in self.color_map]
                 self.plot_manager.plot_data(df, sel, fresh=True, color_map=self.color_map)
 
-                # Restore saved plot_state (xlim, ylim) from config.json if available
-                plot_state = self.config.get("plot_state", {})
-                if "xlim" in plot_state:
+                # Restore saved view (xlim, ylim, home for Esc / 'r') from config.json if available
+                if plot_state.get("home_xlim"):
+                    self.plot_manager.home_xlim = tuple(plot_state["home_xlim"])
+                if plot_state.get("xlim"):
                     self.plot_manager.ax.set_xlim(plot_state["xlim"])
-                if "ylim" in plot_state:
+                if plot_state.get("ylim"):
                     self.plot_manager.ax.set_ylim(plot_state["ylim"])
                 self.plot_manager.canvas.draw_idle()
 
@@ -776,6 +797,7 @@ class MetricsApp:
            If no data is available, show a stub message instead of a blank panel.
         """
         self._rebuilding_table = True  # 🔒 block redraws while we rebuild
+        self._table_update_gen += 1  # drop in-flight table updates built for the old df/sheet
 
         # Clear out old widgets and stale sheet reference
         for widget in self.table_frame.winfo_children():
@@ -812,6 +834,7 @@ class MetricsApp:
 
         df = df.reset_index(drop=True)
         self.df = df
+        self._sort_cache = {}
         # (Re)build checkboxes
         self.build_column_checkboxes(df.columns, getattr(self, "_saved_col_states", None))
 
@@ -820,24 +843,14 @@ class MetricsApp:
         selected_cols = self._ensure_at_least_one_column_selected()
 
         # Stable ordering vector
-        self._table_order = np.arange(len(df), dtype=int)
+        self._table_order = np.arange(len(df), dtype=np.int64)
 
         # Compose headers + data matrix
-        present = [c for c in selected_cols if c in self.df.columns]
-        missing = [c for c in selected_cols if c not in self.df.columns]
-
-        if present:
-            visible_idx = [self.df.columns.get_loc(c) for c in present]
-            full_data = self.df.iloc[self._table_order, visible_idx].to_numpy(copy=False).tolist()
-        else:
-            full_data = [[] for _ in range(len(self._table_order))]
-
-        if missing:
-            for r in full_data:
-                r.extend([""] * len(missing))
-
-        headers = present + missing
+        headers, full_data = self._compose_table_matrix(selected_cols)
+        present = [c for c in headers if c in self.df.columns]
+        missing = [c for c in headers if c not in self.df.columns]
         self._cached_headers = headers
+        self._visible_col_idx_map = [self.df.columns.get_loc(c) for c in present]
 
         # Always create a fresh Sheet
         from tksheet import Sheet
@@ -1099,6 +1112,13 @@ class MetricsApp:
             update_select_all_states()
             self._save_config_now()
 
+        # Freeze geometry while building; widgets are created first and
+        # gridded in one pass afterwards so Tk recomputes layout once.
+        frames = (self.metrics_col_frame, self.other_col_frame)
+        for frame in frames:
+            frame.grid_propagate(False)
+        pending = []  # (widget, row, column)
+
         # --- Metrics checkboxes ---
         for i, col in enumerate(metrics):
             default_val = col_states.get(col, True)  # use saved state
@@ -1111,19 +1131,19 @@ class MetricsApp:
                 fg_color=self.color_map[col],
                 text_color=self.color_map[col],
             )
-            chk.grid(row=i % max_rows, column=i // max_rows, padx=5, pady=5, sticky="w")
+            pending.append((chk, i % max_rows, i // max_rows))
             self.col_vars[col] = var
 
         if metrics:
             self.metrics_toggle.set(all(self.col_vars[c].get() for c in metrics))
             row = len(metrics) % max_rows
             col = len(metrics) // max_rows
-            ctk.CTkCheckBox(
+            pending.append((ctk.CTkCheckBox(
                 self.metrics_col_frame,
                 text="Select All",
                 variable=self.metrics_toggle,
                 command=lambda: (self.toggle_metrics(), update_select_all_states(), self._save_config_now()),
-            ).grid(row=row, column=col, padx=5, pady=5, sticky="w")
+            ), row, col))
 
         # --- Other checkboxes ---
         for i, col in enumerate(others):
@@ -1135,39 +1155,53 @@ class MetricsApp:
                 variable=var,
                 command=per_box_cmd,
             )
-            chk.grid(row=i % max_rows, column=i // max_rows, padx=5, pady=5, sticky="w")
+            pending.append((chk, i % max_rows, i // max_rows))
             self.col_vars[col] = var
 
         if others:
             self.other_toggle.set(all(self.col_vars[c].get() for c in others))
             row = len(others) % max_rows
             col = len(others) // max_rows
-            ctk.CTkCheckBox(
+            pending.append((ctk.CTkCheckBox(
                 self.other_col_frame,
                 text="Select All",
                 variable=self.other_toggle,
                 command=lambda: (self.toggle_others(), update_select_all_states(), self._save_config_now()),
-            ).grid(row=row, column=col, padx=5, pady=5, sticky="w")
+            ), row, col))
+
+        # Second pass: lay everything out; Tk resizes the frames once, at idle time
+        for widget, row, col in pending:
+            widget.grid(row=row, column=col, padx=5, pady=5, sticky="w")
+        for frame in frames:
+            frame.grid_propagate(True)
 
     def _compose_table_matrix(self, selected_cols):
         """Return (headers, data) including blank columns for metrics not in df."""
-        if self.df is None:
+        # Runs on a worker thread: read shared state once so df, order and
+        # the matrix stay consistent if the UI swaps them meanwhile
+        df, order = self.df, self._table_order
+        if df is None:
             return [], []
 
-        present = [c for c in selected_cols if c in self.df.columns]
-        missing = [c for c in selected_cols if c not in self.df.columns]
+        present = [c for c in selected_cols if c in df.columns]
+        missing = [c for c in selected_cols if c not in df.columns]
 
         # Build data for present columns
-        import numpy as np
-        idxs = [self.df.columns.get_loc(c) for c in present]
-        arr = self.df.iloc[self._table_order, idxs].to_numpy(copy=False) if present else np.empty(
-            (len(self._table_order), 0))
-        data = arr.tolist()
+        idxs = df.columns.get_indexer(present)
+        arr = df.iloc[order, idxs].to_numpy(copy=False) if present else np.empty((len(order), 0))
+
+        # Remember the matrix so a pure row reorder can permute it in place of re-slicing df.
+        # Published with one assignment; entries are never mutated afterwards.
+        self._last_compose = {
+            "cols": tuple(selected_cols),
+            "headers": present + missing,
+            "arr": arr,
+            "order": order,
+            "pad": len(missing),
+        }
 
-        # Append blanks for missing columns
-        if missing:
-            for r in data:
-                r.extend([""] * len(missing))
+        # Plain row lists (tksheet ignores other sequence types); blanks for missing columns
+        data = _table_rows(arr, pad=len(missing))
 
         headers = present + missing
         return headers, data
@@ -1179,7 +1213,12 @@ class MetricsApp:
     def log(self, message: str):
         if self.is_closing:
             return
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        # Reformat only when the wall-clock second changes (tuple swap is thread-safe)
+        now = int(time.time())
+        last_sec, timestamp = self._last_ts
+        if now != last_sec:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+            self._last_ts = (now, timestamp)
         print(f"[{timestamp}] {message}")
 
         def _append():
@@ -1197,17 +1236,17 @@ class MetricsApp:
             self.safe_after(0, _append)
 
     def start_timer(self):
-        self.query_start_time = time.time()
+        self.query_start_time = time.monotonic()
         self.timer_running = True
         self.update_timer()
 
     def update_timer(self):
         if self.is_closing or not self.timer_running:
             return
-        elapsed = time.time() - self.query_start_time
+        elapsed = time.monotonic() - self.query_start_time
         self.timer_label.configure(text=f"⏱ Elapsed: {elapsed:.1f}s")
         # keep the id so we can cancel *just* this loop
-        self._timer_after_id = self.root.after(100, self.update_timer)
+        self._timer_after_id = self.root.after(500, self.update_timer)
 
     def stop_timer(self):
         self.timer_running = False
@@ -1221,21 +1260,42 @@ class MetricsApp:
     def safe_after(self, delay, func, *args, **kwargs):
         if self.is_closing:
             return
+        # Called from worker threads as well: the job can run on the Tk thread
+        # before after() even returns here, so track whether it already ran.
+        # The lock only guards the set, never a Tk call.
+        job = {"id": None, "ran": False}
+
+        def _run():
+            # Drop our id first so after_ids only ever holds pending jobs
+            with self._after_lock:
+                job["ran"] = True
+                self.after_ids.discard(job["id"])
+            func(*args, **kwargs)
+
         try:
-            after_id = self.root.after(delay, func, *args, **kwargs)
-            self.after_ids.append(after_id)
-            return after_id
+            after_id = self.root.after(delay, _run)
         except Exception as e:
             self.log(f"[AFTER] Failed to schedule: {e}")
             return
+        with self._after_lock:
+            job["id"] = after_id
+            if not job["ran"]:
+                self.after_ids.add(after_id)
+        return after_id
+
+    def _take_after_ids(self):
+        """Snapshot and forget the tracked after ids (cancel them outside the lock)."""
+        with self._after_lock:
+            ids = list(self.after_ids)
+            self.after_ids.clear()
+        return ids
 
     def cancel_afters(self):
-        for aid in self.after_ids:
+        for aid in self._take_after_ids():
             try:
                 self.root.after_cancel(aid)
             except Exception as e:
                 self.log(f"[AFTER] Failed to cancel id={aid}: {e}")
-        self.after_ids.clear()
 
     def sort_by_header_click(self, event):
         # Only header clicks
@@ -1249,12 +1309,11 @@ class MetricsApp:
         if vis_col is None or self.df is None or self.df.empty:
             return
 
-        # Map visible column index -> real df column index
-        visible_cols = [i for i, col in enumerate(self.df.columns) if self.col_vars[col].get()]
-        if not (0 <= vis_col < len(visible_cols)):
+        # Map visible column index -> real df column index (cached per column layout)
+        if not (0 <= vis_col < len(self._visible_col_idx_map)):
             return
 
-        col_idx = visible_cols[vis_col]
+        col_idx = self._visible_col_idx_map[vis_col]
         col_name = self.df.columns[col_idx]
 
         # Toggle direction per column
@@ -1269,6 +1328,10 @@ class MetricsApp:
         except Exception:
             x0 = y0 = 0.0
 
+        # Snapshot the data this sort is for; a df swap replaces _sort_cache with a
+        # new dict, so a worker that outlives its data only writes to a dropped one
+        df, sort_cache, cur = self.df, self._sort_cache, self._table_order
+
         import threading
         import pandas as pd
         import numpy as np
@@ -1282,19 +1345,65 @@ class MetricsApp:
             return (0, 1, str(v).casefold())
 
         def worker():
-            order_idx = list(range(len(self._table_order)))
+            order_idx = list(range(len(cur)))
             try:
-                series = self.df.iloc[self._table_order, col_idx]
-                order_idx.sort(key=lambda i: keynorm(series.iat[i]), reverse=not asc)
-                new_order = [self._table_order[i] for i in order_idx]
+                # Per-column dense rank of every df row (ties share a rank, NaN
+                # ranks last) is cached; each click is one stable int argsort of
+                # the ranks in the current order, so ties keep their current
+                # order in both directions and NaNs go first when descending,
+                # as with sort(key=keynorm, reverse=not asc).
+                rank = sort_cache.get(col_name)
+                if rank is None:
+                    series = df.iloc[:, col_idx]
+                    nan_mask = series.isna().to_numpy()
+                    valid = np.flatnonzero(~nan_mask)
+                    if pd.api.types.is_bool_dtype(series):
+                        # Bool: False < True, as uint8
+                        keys = series.to_numpy()[valid].astype(np.uint8)
+                    elif pd.api.types.is_numeric_dtype(series):
+                        # Numeric: native sort on the raw buffer
+                        keys = series.to_numpy()[valid]
+                    elif pd.api.types.is_datetime64_any_dtype(series):
+                        # Datetimes: int64 ns view (NaT is already masked out)
+                        keys = series.to_numpy(dtype="datetime64[ns]")[valid].view("i8")
+                    elif pd.api.types.infer_dtype(series, skipna=True) == "string":
+                        folded = series.iloc[valid].str.casefold()
+                        if folded.nunique() < len(folded) // 4:
+                            # Low cardinality: the codes of an ordered Categorical
+                            # already are dense ranks, no string comparisons needed
+                            keys = pd.Categorical(folded).codes
+                        else:
+                            # Strings: casefold once, then a single native sort
+                            keys = folded.to_numpy()
+                    else:
+                        keys = None
+
+                    if keys is not None:
+                        _, inv = np.unique(keys, return_inverse=True)
+                        rank = np.empty(len(series), dtype=np.int64)
+                        rank[valid] = inv.ravel()
+                        rank[nan_mask] = inv.max() + 1 if len(inv) else 0
+                    else:
+                        # Mixed object column: tuple keys (NaNs rank last)
+                        keys = [keynorm(v) for v in series.to_numpy()]
+                        by_key = sorted(range(len(keys)), key=keys.__getitem__)
+                        rank = np.empty(len(keys), dtype=np.int64)
+                        r, prev = -1, None
+                        for i in by_key:
+                            if keys[i] != prev:
+                                r, prev = r + 1, keys[i]
+                            rank[i] = r
+                    sort_cache[col_name] = rank
+
+                r = rank[cur]
+                new_order = cur[np.argsort(r if asc else -r, kind="stable")]
             except Exception:
                 # Fallback: safe but slower path
-                series = [self.df.iat[r, col_idx] for r in self._table_order]
+                series = [df.iat[r, col_idx] for r in cur]
                 order_idx.sort(key=lambda i: keynorm(series[i]), reverse=not asc)
-                new_order = [self._table_order[i] for i in order_idx]
+                new_order = cur[np.asarray(order_idx, dtype=np.int64)]
 
-            def apply():
-                self._apply_row_order(new_order)
+            def restore_view():
                 try:
                     MT.xview_moveto(x0)
                     MT.yview_moveto(y0)
@@ -1303,6 +1412,9 @@ class MetricsApp:
                     pass
                 self.log(f'Sorted by “{col_name}” ({"asc" if asc else "desc"})')
 
+            def apply():
+                self._apply_row_order(new_order, on_done=restore_view, source_df=df)
+
             self.safe_after(0, apply)
 
         threading.Thread(target=worker, daemon=True).start()
@@ -1457,10 +1569,17 @@ class MetricsApp:
                     self._last_filter = (self.filter_type.get(), self.filter_value.get())
                     self.log(f"✅ Filter changed; dataset reset with {len(self.df)} rows.")
 
+            # Cached sort orders refer to the previous dataset
+            self._sort_cache = {}
+            self._last_compose = None
+            self._table_update_gen += 1  # in-flight table updates were composed from the old df
+
             # 🚀 Dispatch GUI updates
             if self.df is not None and not self.df.empty:
                 self.safe_after(0, lambda: self._render_first_time(self.df))
-                self.safe_after(0, lambda: self._update_status_labels(self.df))
+                # Scalar lookups stay in the worker; the UI thread only updates labels
+                user_val = self._first_valid(self.df, "user_id", "?")
+                self.safe_after(0, lambda: self._update_status_labels(self.df, user_val=user_val))
                 self.safe_after(0, lambda: self._save_cache_ui(self.df))
 
         except Exception as e:
@@ -1504,20 +1623,32 @@ class MetricsApp:
         col_states = {col: (self.col_vars[col].get() if col in self.col_vars else True)
                       for col in df.columns}
 
-        ok = self.plot_manager._save_cache(df, col_states)
+        def done(ok):
+            # Runs on the cache writer thread → hop back to Tk
+            if ok:
+                self.safe_after(0, self._on_cache_saved, df, sum(col_states.values()))
+            else:
+                self.safe_after(0, self.log, "❌ Cache save failed (no columns or write error).")
 
-        if ok:
-            self._last_cache_signature = self._cache_signature(df)
-            self.log(f"💾 Cache saved with {sum(col_states.values())} selected columns")
-        else:
-            self.log("❌ Cache save failed (no columns or write error).")
-        return ok
+        return self.plot_manager._save_cache(df, col_states, on_done=done)
+
+    def _on_cache_saved(self, df, n_selected):
+        self._last_cache_signature = self._cache_signature(df)
+        self.log(f"💾 Cache saved with {n_selected} selected columns")
 
-    def _update_status_labels(self, df, time_range=None):
+    @staticmethod
+    def _first_valid(df, col, default):
+        """First non-null value of df[col] without materializing a dropna() copy."""
+        if col not in df.columns:
+            return default
+        idx = df[col].first_valid_index()
+        return df[col].at[idx] if idx is not None else default
+
+    def _update_status_labels(self, df, time_range=None, user_val=None):
         if df.empty:
             return
-        device_val = df["device_name"].dropna().iloc[0] if "device_name" in df else self.filter_value.get()
-        user_val = df["user_id"].dropna().iloc[0] if "user_id" in df else "?"
+        if user_val is None:
+            user_val = self._first_valid(df, "user_id", "?")
         self.current_user_id = user_val
 
         if time_range:
@@ -1539,6 +1670,18 @@ class MetricsApp:
         )
 
     def on_column_change(self):
+        # Coalesce bursts of checkbox changes into one trailing replot/table refresh
+        if self._col_change_after_id:
+            try:
+                self.root.after_cancel(self._col_change_after_id)
+            except Exception:
+                pass
+            with self._after_lock:
+                self.after_ids.discard(self._col_change_after_id)
+        self._col_change_after_id = self.safe_after(50, self._do_column_change)
+
+    def _do_column_change(self):
+        self._col_change_after_id = None
         if self._rebuilding_table:
             return
         if self.df is not None:
@@ -1556,38 +1699,82 @@ class MetricsApp:
             return
         widths = self._get_col_widths()
         selected_cols = self._ensure_at_least_one_column_selected()
-        self._cached_headers, full_data = self._compose_table_matrix(selected_cols)
-        self.sheet.headers(self._cached_headers, redraw=False)
-        self.sheet.set_sheet_data(full_data, redraw=False)
-        try:
-            self.sheet.refresh()
-        except Exception:
-            pass
+        self._do_update_table(lambda: self._compose_table_matrix(selected_cols), widths, autofit=True)
 
-        if widths:
-            self._set_col_widths(widths)
-        else:
+    def _do_update_table(self, compose, widths, autofit=False, on_done=None):
+        """Run compose() -> (headers, data) in a background thread and schedule
+           only the tksheet write on the UI thread. Results from superseded
+           updates are dropped.
+        """
+        self._table_update_gen += 1
+        gen = self._table_update_gen
+
+        def worker():
             try:
-                ncols = len(self._cached_headers)
-                for c in range(ncols):
-                    self.sheet.column_width(c, "fit", redraw=False)
-                self.sheet.refresh()
+                headers, full_data = compose()
             except Exception as e:
-                self.log(f"[WARN] Auto-fit failed: {e}")
+                self.log(f"[WARN] Table update failed: {e}")
+                return
 
-    def _apply_row_order(self, new_order):
+            def apply():
+                if gen != self._table_update_gen or not hasattr(self, "sheet") or self.df is None:
+                    return
+                self._cached_headers = headers
+                self._visible_col_idx_map = [
+                    self.df.columns.get_loc(c) for c in headers if c in self.df.columns
+                ]
+                self.sheet.headers(headers, redraw=False)
+                self.sheet.set_sheet_data(full_data, redraw=False)
+                try:
+                    self.sheet.refresh()
+                except Exception:
+                    pass
+
+                if widths:
+                    self._set_col_widths(widths)
+                elif autofit:
+                    try:
+                        for c in range(len(headers)):
+                            self.sheet.column_width(c, "fit", redraw=False)
+                        self.sheet.refresh()
+                    except Exception as e:
+                        self.log(f"[WARN] Auto-fit failed: {e}")
+
+                if on_done:
+                    on_done()
+
+            self.safe_after(0, apply)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _apply_row_order(self, new_order, on_done=None, source_df=None):
+        """Show the table in new_order. source_df is the frame the order was
+           computed from; if the data has been replaced since, the order is
+           dropped (its row positions belong to the old frame).
+        """
         if self.df is None or not hasattr(self, "sheet"):
             return
-        import numpy as np
-        self._table_order = np.array(new_order, dtype=int)
+        if source_df is not None and source_df is not self.df:
+            return
+        self._table_order = np.asarray(new_order, dtype=np.int64)
+        order = self._table_order
         widths = self._get_col_widths()
         selected_cols = self._ensure_at_least_one_column_selected()
-        self._cached_headers, full_data = self._compose_table_matrix(selected_cols)
-        self.sheet.headers(self._cached_headers, redraw=False)
-        self.sheet.set_sheet_data(full_data, redraw=False)
-        self.sheet.refresh()
-        if widths:
-            self._set_col_widths(widths)
+
+        def compose():
+            last = self._last_compose
+            if (last is not None and last["cols"] == tuple(selected_cols)
+                    and len(last["order"]) == len(order)):
+                # Only the row permutation changed: reorder the cached matrix
+                # (position of each row in the old order, then gather) and skip pandas.
+                inv = np.empty_like(last["order"])
+                inv[last["order"]] = np.arange(len(last["order"]))
+                arr = last["arr"][inv[order]]
+                self._last_compose = {**last, "arr": arr, "order": order}
+                return last["headers"], _table_rows(arr, pad=last["pad"])
+            return self._compose_table_matrix(selected_cols)
+
+        self._do_update_table(compose, widths, on_done=on_done)
 
     def on_select(self, eclick, erelease):
         pass
@@ -1626,7 +1813,7 @@ class MetricsApp:
                 "table": self.table_section.get_state(),
                 "log": self.log_section.get_state(),
             }
-            config_manager.save_config(cfg)
+            config_manager.update_config(**cfg)
             self.log("[CLOSE] Saved config")
         except Exception as e:
             self.log(f"[CLOSE] Failed to save config: {e}")
@@ -1,7 +1,11 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.collections import PolyCollection
+from downsample import lttb_indices
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 # === CONFIG ===
@@ -14,6 +18,9 @@ MIN_COOLING_RATE = 0.2       # °F per minute
 MIN_COMPRESSOR_AMP = 2.3     # amps (too low if below this)
 MAX_COMPRESSOR_AMP = 4.0     # amps (too high if above this)
 
+# Plotting
+PLOT_MAX_POINTS = 2000       # LTTB target per series (detection always uses full data)
+
 COLUMNS = [
     "updated_at",
     "water_temp_f",
@@ -109,19 +116,17 @@ class CycleAnalyzerGUI:
     def analyze_cycles(self, df):
         self.text.insert("end", f"\nAnalyzing {len(df)} rows...\n")
 
-        cycles = []
-        in_cycle = False
-        start_idx = None
-
-        for i, row in df.iterrows():
-            compressor_on = row["compressor_current_amp"] > COMPRESSOR_THRESHOLD
-            if compressor_on and not in_cycle:
-                in_cycle = True
-                start_idx = i
-            elif not compressor_on and in_cycle:
-                in_cycle = False
-                end_idx = i
-                cycles.append((start_idx, end_idx))
+        # Detect ON/OFF edges positionally: a cycle runs from the first ON row
+        # to the first OFF row after it; a cycle still open at the end is dropped.
+        amps = df["compressor_current_amp"].to_numpy(dtype=float)
+        on = amps > COMPRESSOR_THRESHOLD
+        edges = np.diff(on.astype(np.int8))
+        starts = np.flatnonzero(edges == 1) + 1
+        if len(on) and on[0]:
+            starts = np.r_[0, starts]
+        ends = np.flatnonzero(edges == -1) + 1
+        starts = starts[:len(ends)]
+        cycles = list(zip(starts.tolist(), ends.tolist()))
 
         if not cycles:
             self.text.insert("end", "No cooling cycles detected.\n")
@@ -129,21 +134,55 @@ class CycleAnalyzerGUI:
 
         self.text.insert("end", f"Detected {len(cycles)} cooling cycles\n")
 
+        # Per-cycle aggregates over the inclusive [start, end] rows in one pass
+        # per column: even reduceat segments are the cycles, odd ones the gaps.
+        bounds = np.column_stack([starts, ends + 1]).ravel()
+        amps_valid = ~np.isnan(amps)
+        amp_sums = np.add.reduceat(np.append(np.where(amps_valid, amps, 0.0), 0.0), bounds)[::2]
+        amp_counts = np.add.reduceat(np.append(amps_valid, False).astype(np.int64), bounds)[::2]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg_currents = np.where(amp_counts > 0, amp_sums / amp_counts, np.nan)
+        targets = np.append(df["target_temp_f"].to_numpy(dtype=float), np.nan)
+        target_mins = np.fmin.reduceat(targets, bounds)[::2]
+
+        # Cycle timing/temperature on raw int64 ns + float arrays (no Timestamp churn)
+        times = df["updated_at"].to_numpy().astype("datetime64[ns]")
+        times_ns = times.view("i8")
+        water = df["water_temp_f"].to_numpy(dtype=float)
+        durations_min = (times_ns[ends] - times_ns[starts]) / 60_000_000_000
+        start_temps = water[starts]
+        end_temps = water[ends]
+        cooling_rates = (start_temps - end_temps) / np.maximum(durations_min, 1e-3)
+        span_x0 = mdates.date2num(times[starts])
+        span_x1 = mdates.date2num(times[ends])
+
         # Create matplotlib figure
         fig, ax = plt.subplots(figsize=(10, 5))
-        ax.plot(df["updated_at"], df["water_temp_f"], label="Water Temp (°F)")
-        ax.plot(df["updated_at"], df["target_temp_f"], label="Target Temp (°F)", linestyle="--")
-        ax.plot(df["updated_at"], df["compressor_current_amp"], label="Compressor Current", alpha=0.6)
-        ax.plot(df["updated_at"], df["pump_current_amp"], label="Pump Current", alpha=0.6)
-
-        for (s, e) in cycles:
-            start_time = df.loc[s, "updated_at"]
-            end_time = df.loc[e, "updated_at"]
-            duration_min = (end_time - start_time).total_seconds() / 60
-            start_temp = df.loc[s, "water_temp_f"]
-            end_temp = df.loc[e, "water_temp_f"]
-            cooling_rate = (start_temp - end_temp) / max(duration_min, 1e-3)
-            target_temp = df.loc[s:e, "target_temp_f"].min()
+        # One plot call over a shared x array; per-line styling applied afterwards.
+        # Each series is LTTB-downsampled and the union of picked rows is drawn,
+        # so every line keeps its own peaks while x stays shared.
+        ys = df[["water_temp_f", "target_temp_f", "compressor_current_amp", "pump_current_amp"]].to_numpy(dtype=float)
+        x_num = times_ns.astype(np.float64)
+        keep = np.unique(np.concatenate(
+            [lttb_indices(x_num, ys[:, k], PLOT_MAX_POINTS) for k in range(ys.shape[1])]
+        ))
+        water_ln, target_ln, comp_ln, pump_ln = ax.plot(
+            times[keep], ys[keep],
+            label=["Water Temp (°F)", "Target Temp (°F)", "Compressor Current", "Pump Current"],
+        )
+        target_ln.set_linestyle("--")
+        comp_ln.set_alpha(0.6)
+        pump_ln.set_alpha(0.6)
+
+        span_verts = []
+        span_colors = []
+        summaries = []
+
+        for k, (s, e) in enumerate(cycles):
+            duration_min = durations_min[k]
+            end_temp = end_temps[k]
+            cooling_rate = cooling_rates[k]
+            target_temp = target_mins[k]
 
             anomaly_reasons = []
             if duration_min > MAX_EXPECTED_DURATION:
@@ -156,15 +195,19 @@ class CycleAnalyzerGUI:
                 anomaly_reasons.append("target not reached")
 
             # New: Check compressor amps
-            avg_current = df.loc[s:e, "compressor_current_amp"].mean()
+            avg_current = avg_currents[k]
             if avg_current < MIN_COMPRESSOR_AMP:
                 anomaly_reasons.append("compressor current too low")
             elif avg_current > MAX_COMPRESSOR_AMP:
                 anomaly_reasons.append("compressor current too high")
 
             color = "green" if not anomaly_reasons else "red"
-            ax.axvspan(start_time, end_time, color=color, alpha=0.2)
+            x0, x1 = span_x0[k], span_x1[k]
+            span_verts.append([(x0, 0), (x0, 1), (x1, 1), (x1, 0)])
+            span_colors.append(color)
 
+            # Timestamps are only materialized for the label
+            start_time, end_time = pd.Timestamp(times[s]), pd.Timestamp(times[e])
             summary = (
                 f"Cycle {start_time:%m-%d %H:%M} → {end_time:%m-%d %H:%M} | "
                 f"{duration_min:.1f} min, rate={cooling_rate:.2f} °F/min, "
@@ -174,7 +217,17 @@ class CycleAnalyzerGUI:
                 summary += " ⚠️ " + ", ".join(anomaly_reasons)
             else:
                 summary += " ✅ normal"
-            self.text.insert("end", summary + "\n")
+            summaries.append(summary)
+
+        # One Text insert for the whole report instead of a Tcl round-trip per cycle
+        self.text.insert("end", "\n".join(summaries) + "\n")
+
+        # All cycle spans as a single collection (x in data, y in axes coords)
+        ax.add_collection(
+            PolyCollection(span_verts, facecolors=span_colors, edgecolors="none", alpha=0.2,
+                           transform=ax.get_xaxis_transform()),
+            autolim=False,
+        )
 
         ax.set_xlabel("Time")
         ax.set_ylabel("Values")
@@ -4,10 +4,53 @@ import customtkinter as ctk
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.widgets import RectangleSelector
-from datetime import timedelta, datetime
-import json, os
+from matplotlib.patches import Rectangle
+from matplotlib.offsetbox import AnnotationBbox, TextArea, VPacker
+from datetime import datetime
+import json, os, time
+from concurrent.futures import ThreadPoolExecutor
 
+from downsample import DOWNSAMPLERS, DEFAULT_DOWNSAMPLER, gap_indices
+
+
+MAX_TOOLTIP_LINES = 24  # pooled tooltip text artists (timestamp + device + metrics)
+MOTION_INTERVAL = 0.033  # seconds between handled hover events (~30 FPS)
+PARALLEL_CONVERT_ROWS = 200_000  # below this many rows, threads cost more than the float32 casts
+
+# Let Agg drop sub-pixel vertices at draw time (cheap on top of decimation), and
+# render long paths in chunks so it never rasterizes one huge path at once.
+# Applied only around this figure's draws, so other figures (pca.py) keep the defaults.
+PLOT_RC = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
+
+
+class _PlotCanvas(FigureCanvasTkAgg):
+    """TkAgg canvas that renders with PLOT_RC in effect."""
+
+    def draw(self):
+        with plt.rc_context(PLOT_RC):
+            super().draw()
+
+# Matplotlib date floats are days since its epoch; convert straight to int64 ns
+MPL_EPOCH_NS = int(np.datetime64(mdates.get_epoch(), "ns").astype("i8"))
+NS_PER_DAY = 86_400_000_000_000
+
+
+def _num_to_ns(x):
+    return MPL_EPOCH_NS + int(x * NS_PER_DAY)
+
+
+def _ts_label(ns):
+    """int ns -> 'YYYY-MM-DD HH:MM:SS' via NumPy's C formatter (no Timestamp/strftime)."""
+    return str(np.datetime64(int(ns), "ns").astype("datetime64[s]")).replace("T", " ")
+
+
+def _to_num(ts):
+    """Naive datetime/Timestamp -> matplotlib date float, same arithmetic as _x_md."""
+    return (pd.Timestamp(ts).value - MPL_EPOCH_NS) / NS_PER_DAY
 
 
 class PlotManager:
@@ -16,7 +59,9 @@ class PlotManager:
         self.fig = None
         self.ax = None
         self.canvas = None
-        self.selector = None
+        self._rubber = None                  # zoom rubber-band patch while the left button is held
+        self._rubber_press = None            # press event the rubber band started from
+        self._rubber_inv = None              # display -> data transform, fixed for the drag
         self.tooltip_enabled = True  # default ON
 
         # Data store
@@ -24,15 +69,35 @@ class PlotManager:
         self.current_columns = []
         self.line_colors = {}
         self.lines = {}  # col -> Line2D
+        self._legend_keys = None             # labels the current legend was built for
 
         # Crosshair + tooltip
         self.vline = None
         self._tooltip = None
+        self._tooltip_box = None             # single AnnotationBbox holding the tooltip rows
+        self._tooltip_rows = []              # pooled TextArea rows inside the box
+        self._blit_bg = None                 # figure background for blitting the tooltip
+        self._last_snap_idx = -1             # row the tooltip text was last built for
+        self._last_px = (None, None)         # pixel position of the last handled move
+        self._last_motion_ts = 0.0           # monotonic time of the last handled move
+        self._pending_motion = None          # newest move deferred by the ~30 FPS coalescer
+        self._motion_timer = None
+        self._draw_timer = None              # one-shot ~16 ms timer coalescing pan/zoom/key redraws
+        self._draw_pending = False
+        self._drag_bg = None                 # line-free background captured at pan start
+        self._pan_timer = None               # one-shot ~16 ms timer applying the latest pan offset
+        self._pan_px = None                  # newest drag position (px) not yet applied
+        self._redecimate_timer = None        # one-shot ~50 ms timer throttling view re-decimation
+        self._redecimate_pending = False
 
         # X time caches (for quick search)
-        self._x_pd = None                    # pandas datetime Series (tz-naive)
-        self._x_np = None                    # numpy datetime64[ns] array (sorted)                 # matplotlib float date numbers (optional)
-        self._ds_idx = None                  # downsample indices for plotting
+        self._x_md = None                    # float64 matplotlib date numbers (what lines are drawn with)
+        self._ts_ns = None                   # int64 ns since epoch (sorted), for searchsorted
+        self._cols = {}                      # numeric col -> float32 array aligned with _ts_ns (SoA)
+        self._col_arrays = {}                # non-numeric tooltip cols (device_name) -> raw array
+        self._numeric_cols = frozenset()     # plottable columns of current_df, fixed per dataset
+        self._inv_dt = None                  # 1 / sample step (days) when _x_md is ~uniform, else None
+        self._col_suffix = {}                # col -> " : col" tooltip label, rebuilt per selection
 
         # Store "home view"
         self.home_xlim = None
@@ -41,18 +106,24 @@ class PlotManager:
         self.on_select_hook = on_select
         self.on_key_hook = on_key
 
-        # Cache files
-        self.cache_file = "plot_cache.parquet"
+        # Cache files (Feather/Arrow IPC: uncompressed local round-trip)
+        self.cache_file = "plot_cache.arrow"
+        self.legacy_cache_file = "plot_cache.parquet"  # written by older versions; read if no .arrow yet
         self.meta_file = "plot_cache_meta.json"
+        self._cache_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plot-cache")
+        self._pending_save = None            # Future of the queued/running cache write
 
         # Perf knobs
         self.max_points = int(max_points)    # hard cap on points per line
+        self.downsample_method = DEFAULT_DOWNSAMPLER  # key into downsample.DOWNSAMPLERS
 
     def show_message(self, msg: str, color="red"):
         """Display a centered message on the plot instead of data."""
         if self.fig is None or self.ax is None or self.canvas is None:
             self.init_plot()
         self.ax.clear()
+        self._reset_tooltip_artists()
+        self._connect_axes_callbacks()
         self.ax.text(
             0.5, 0.5, msg,
             ha="center", va="center", transform=self.ax.transAxes,
@@ -72,9 +143,9 @@ class PlotManager:
         self.plot_container = ctk.CTkFrame(self.output_frame)
         self.plot_container.pack(fill="both", expand=True, padx=10, pady=10)
 
-        # Create figure + canvas
+        # Create figure + canvas (draws run with PLOT_RC)
         self.fig, self.ax = plt.subplots()
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_container)
+        self.canvas = _PlotCanvas(self.fig, master=self.plot_container)
 
         # Toolbar (must be created AFTER canvas, and explicitly packed)
         self.toolbar = NavigationToolbar2Tk(self.canvas, self.plot_container)
@@ -84,13 +155,7 @@ class PlotManager:
         # Canvas widget
         self.canvas.get_tk_widget().pack(side="top", fill="both", expand=True)
 
-        # Rectangle selector
-        self.selector = RectangleSelector(
-            self.ax, self._on_select,
-            useblit=True, interactive=False,
-            drag_from_anywhere=True, button=[1]
-        )
-
+        # Zoom-to-rect is a blitted rubber band driven by the press/motion/release handlers below
         # Events
         self.fig.canvas.mpl_connect("motion_notify_event", self._on_mouse_motion)
         self.fig.canvas.mpl_connect("key_press_event", self._on_key)
@@ -99,6 +164,7 @@ class PlotManager:
         self.fig.canvas.mpl_connect("button_release_event", self._on_mouse_release)
         self.fig.canvas.mpl_connect("axes_enter_event", self._on_axes_enter)
         self.fig.canvas.mpl_connect("figure_leave_event", self._on_figure_leave)
+        self.fig.canvas.mpl_connect("draw_event", self._on_draw)
 
         # Labels & formatting
         self.ax.set_title("Device Metrics")
@@ -111,6 +177,15 @@ class PlotManager:
         self.ax.xaxis.set_major_locator(locator)
         self.ax.xaxis.set_major_formatter(formatter)
         self.fig.autofmt_xdate(rotation=0, ha="center")
+        self._connect_axes_callbacks()
+
+    def _connect_axes_callbacks(self):
+        # ax.clear() drops axes callbacks, so this is re-run after every clear
+        self.ax.callbacks.connect("xlim_changed", self._schedule_redecimate)
+        # New limits make the cached tooltip background stale until the next full draw
+        self.ax.callbacks.connect("xlim_changed", self._invalidate_blit_bg)
+        self.ax.callbacks.connect("ylim_changed", self._invalidate_blit_bg)
+
     def _on_axes_enter(self, event):
         # restore normal tooltip mode
         self._tooltip_mode = "cursor"
@@ -126,23 +201,30 @@ class PlotManager:
         # This is the *only* source of truth
         selected = set(selected_columns or [])
         self.current_columns = list(selected)
+        self._col_suffix = {col: f" : {col}" for col in self.current_columns}
+        self._last_snap_idx = -1  # tooltip text depends on the column set
 
         if df is None:
             return
 
-        # Break time gaps
-        df = self._break_time_gaps(df, threshold="1D")
-
         # Ensure plot exists
         if self.fig is None or self.ax is None or self.canvas is None:
             self.init_plot()
 
         if fresh:
             self.lines.clear()
-            self.vline = None
             self._tooltip = None
             self.ax.clear()
+            self._reset_tooltip_artists()
+            self._connect_axes_callbacks()
+            self.ax.xaxis_date()  # lines get float date numbers; keep the date converter/ticks
             self.current_df = pd.DataFrame()
+            self._ts_ns = None
+            self._x_md = None
+            self._cols = {}
+            self._col_arrays = {}
+            self._numeric_cols = frozenset()
+            self.home_xlim = None  # belongs to the previous dataset; callers set the new one
 
             # Handle empty selection immediately
             if not selected:
@@ -150,6 +232,10 @@ class PlotManager:
                 self.canvas.draw_idle()
                 return
 
+            # Break time gaps. Only a fresh load reads df; selection toggles reuse current_df,
+            # so they never pay for this sort/scan/concat.
+            df = self._break_time_gaps(df, threshold="1D")
+
             # Normal datetime prep
             if "updated_at" not in df.columns:
                 self.ax.text(0.5, 0.5, "No results",
@@ -158,103 +244,297 @@ class PlotManager:
                 self.canvas.draw_idle()
                 return
 
-            df = df.copy()
+            # No defensive copy: _break_time_gaps already returned a new frame, and
+            # assign() only swaps the one column when coercion is needed
             if not pd.api.types.is_datetime64_any_dtype(df["updated_at"]):
-                df["updated_at"] = pd.to_datetime(df["updated_at"], errors="coerce")
-
-            df = df.dropna(subset=["updated_at"]).sort_values("updated_at")
+                df = df.assign(updated_at=pd.to_datetime(df["updated_at"], errors="coerce", cache=True))
+
+            # Drop NaT + sort in one take(); usually a no-op since _break_time_gaps sorted already
+            ts = df["updated_at"].to_numpy(dtype="datetime64[ns]")
+            valid = ~np.isnat(ts)
+            ts_ns = ts.view("i8")
+            if not (valid.all() and bool((np.diff(ts_ns) >= 0).all())):
+                keep = np.flatnonzero(valid)
+                order = keep[np.argsort(ts_ns[keep], kind="stable")]
+                df = df.take(order)
+                ts_ns = ts_ns[order]
             self.current_df = df
-            self._x_pd = df["updated_at"]
-            self._x_np = self._x_pd.values.astype("datetime64[ns]")
-
-        # 🔥 Rebuild exactly what’s selected
-        # Remove all old lines first
-        for line in list(self.lines.values()):
-            line.remove()
-        self.lines.clear()
+            self._numeric_cols = frozenset(c for c, dt in df.dtypes.items() if pd.api.types.is_numeric_dtype(dt))
+            # All validation happens here, once per dataset; the hover path trusts _ts_ns is sorted
+            self._ts_ns = ts_ns
+            # Date floats once, so set_data/plot never re-run the datetime unit converter
+            self._x_md = (self._ts_ns - MPL_EPOCH_NS) / NS_PER_DAY
+            # Fixed-interval polling → the hover index is a multiply, not a binary search
+            self._inv_dt = None
+            if self._x_md.size > 2:
+                step = np.diff(self._x_md)
+                mean = step.mean()
+                if mean > 0 and step.std() < 0.01 * mean:
+                    self._inv_dt = 1.0 / mean
+            if self._ts_ns.size == 0:
+                self._ts_ns = None
+
+        # Columnar (SoA) numpy views for plotting + the tooltip hot path, built once per column.
+        # float32 is plenty for on-screen values and halves the bytes every decimation pass reads.
+        # The numeric set is fixed at load, so no dtype check or to_numeric per redraw.
+        # Casts release the GIL, so several new large columns convert on threads.
+        cdf = self.current_df
+        new_cols = [c for c in selected if c in self._numeric_cols and c not in self._cols]
+
+        def to_f32(col):
+            return cdf[col].to_numpy(dtype=np.float32, na_value=np.nan)
+
+        workers = min(len(new_cols), os.cpu_count() or 1)
+        if workers > 1 and len(cdf) >= PARALLEL_CONVERT_ROWS:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                self._cols.update(zip(new_cols, ex.map(to_f32, new_cols)))
+        else:
+            self._cols.update((col, to_f32(col)) for col in new_cols)
+        if "device_name" in self.current_df.columns and "device_name" not in self._col_arrays:
+            self._col_arrays["device_name"] = self.current_df["device_name"].to_numpy()
+
+        # 🔥 Sync lines with what’s selected: unchecked lines are only hidden, so
+        # re-checking a column reuses its Line2D instead of another ax.plot()
+        for col in [c for c in self.lines if c not in self._cols]:
+            self.lines.pop(col).remove()
+        for col, line in self.lines.items():
+            if col not in selected:
+                line.set_visible(False)
 
         if not selected:
             self._draw_fixed_legend()
             self.canvas.draw_idle()
             return
 
-        # Add back only checked columns
-        for col in selected:
-            if col in self.current_df.columns and pd.api.types.is_numeric_dtype(self.current_df[col]):
-                series = pd.to_numeric(self.current_df[col], errors="coerce")
-                sub = pd.DataFrame({"updated_at": self._x_pd, col: series})
-                if self._ds_idx is not None:
-                    sub = sub.iloc[self._ds_idx]
-                line, = self.ax.plot(
-                    sub["updated_at"], sub[col],
-                    label=col,
-                    color=(color_map.get(col) if color_map and col in color_map else None),
-                )
-                self.lines[col] = line
+        # Only never-seen columns get a new artist; hidden ones are refreshed for the current view
+        lo, hi = (0, len(self.current_df)) if fresh else self._view_slice()
+        reshown = False
+        # ax.plot/relim build the line paths here, outside a draw: give them PLOT_RC too
+        with plt.rc_context(PLOT_RC):
+            for col in selected:
+                if col not in self._cols:
+                    continue
+                color = color_map.get(col) if color_map and col in color_map else self.line_colors.get(col)
+                line = self.lines.get(col)
+                if line is None:
+                    x, y = self._decimate(col, lo, hi)
+                    # miter/butt: no round join/cap geometry per vertex for Agg to fill
+                    line, = self.ax.plot(x, y, label=col, color=color,
+                                         solid_joinstyle="miter", solid_capstyle="butt")
+                    self.lines[col] = line
+                else:
+                    if not line.get_visible():
+                        line.set_data(*self._decimate(col, lo, hi))  # view may have moved while hidden
+                        line.set_visible(True)
+                        reshown = True
+                    if color is not None:
+                        line.set_color(color)
                 self.line_colors[col] = line.get_color()
+            if reshown:
+                # set_data doesn't touch dataLim the way ax.plot does
+                self.ax.relim(visible_only=True)
+                self.ax.autoscale_view()
 
         # Update legend
         self._draw_fixed_legend()
         self.canvas.draw_idle()
 
-    def _save_cache(self, df, col_states=None):
+    # -------------------------------
+    # Viewport decimation
+    # -------------------------------
+    def _view_slice(self):
+        """Row range [lo, hi) covering the current xlim, padded by one point each side.
+        All visible-range queries go through this (searchsorted on _ts_ns), never pandas slicing."""
+        ts = self._ts_ns
+        if ts is None or len(ts) == 0:
+            return 0, 0
+        ns0, ns1 = sorted(_num_to_ns(v) for v in self.ax.get_xlim())
+        lo = max(int(np.searchsorted(ts, ns0)) - 1, 0)
+        hi = min(int(np.searchsorted(ts, ns1, side="right")) + 1, len(ts))
+        return lo, hi
+
+    def _decimate(self, col, lo, hi):
+        """Downsample rows [lo, hi) of col to about 2 points per pixel column (capped by max_points)."""
+        x = self._x_md[lo:hi]
+        y = self._cols[col][lo:hi]
+        n_px = int(self.ax.bbox.width) or self.max_points
+        n_out = min(2 * n_px, self.max_points)
+        if hi - lo <= n_out:
+            return x, y  # few enough rows: plot the raw slice (views, no gather)
+        idx = DOWNSAMPLERS[self.downsample_method](x, y, n_out)
+        return x[idx], y[idx]
+
+    def _schedule_redecimate(self, ax=None):
+        """xlim_changed hook: re-decimate at most once per ~50 ms while pan/zoom events stream in."""
+        if self._redecimate_pending or not self.lines:
+            return
+        if self._redecimate_timer is None:
+            self._redecimate_timer = self.canvas.new_timer(interval=50)
+            self._redecimate_timer.single_shot = True
+            self._redecimate_timer.add_callback(self._flush_redecimate)
+        self._redecimate_pending = True
+        self._redecimate_timer.start()
+
+    def _flush_redecimate(self):
+        self._redecimate_pending = False
+        self._redecimate()
+        if self._drag_bg is not None:
+            self._blit_lines()  # mid-pan: only the lines are live
+        else:
+            self.canvas.draw_idle()
+
+    def _redecimate(self):
+        """Re-slice + decimate each visible line for the current xlim, in place (no new artists)."""
+        if not self.lines or self._ts_ns is None:
+            return
+        lo, hi = self._view_slice()
+        for col, line in self.lines.items():
+            if col in self._cols and line.get_visible():  # hidden lines catch up when re-shown
+                line.set_data(*self._decimate(col, lo, hi))
+
+    def _save_cache(self, df, col_states=None, on_done=None):
+        """
+        Queue a cache write on the background writer and return immediately.
+        A newer save supersedes one that hasn't started yet. on_done(ok) is
+        called from the writer thread; marshal back to Tk before touching widgets.
+        """
+        # Axes state is read here, on the UI thread
+        view = self.view_state()
+
+        if self._pending_save is not None and not self._pending_save.done():
+            self._pending_save.cancel()
+        fut = self._cache_pool.submit(self._write_cache, df, col_states, view)
+        if on_done is not None:
+            fut.add_done_callback(lambda f: None if f.cancelled() else on_done(f.result()))
+        self._pending_save = fut
+        return True
+
+    def view_state(self):
+        """JSON-ready view state: current limits and the home view Esc / 'r' returns to."""
+        return {
+            "xlim": list(self.ax.get_xlim()) if self.ax else None,
+            "ylim": list(self.ax.get_ylim()) if self.ax else None,
+            "home_xlim": list(self.home_xlim) if self.home_xlim is not None else None,
+        }
+
+    def _write_cache(self, df, col_states, view):
         try:
             cols = list(df.columns)
             if "updated_at" not in cols:
                 cols.append("updated_at")
 
-            if "updated_at" in df.columns and not df.empty:
-                earliest = pd.to_datetime(df["updated_at"]).min()
-                latest = pd.to_datetime(df["updated_at"]).max()
-                earliest_iso = earliest.isoformat()
-                latest_iso = latest.isoformat()
-            else:
-                earliest_iso = latest_iso = None
+            earliest_iso, latest_iso = self.time_range(df)
 
-            # Always write parquet (or fallback to CSV)
-            try:
-                df[cols].to_parquet(self.cache_file, index=False)
-                fmt = "parquet"
-            except (ImportError, ValueError):
-                alt_file = os.path.splitext(self.cache_file)[0] + ".csv"
-                df[cols].to_csv(alt_file, index=False)
-                self.cache_file = alt_file
-                fmt = "csv"
+            # Always Feather. No CSV fallback: a missing pyarrow fails the save
+            # loudly instead of leaving a slow-to-load cache.
+            # Written to a temp file and swapped in, so a reader never sees half a file.
+            from pyarrow import feather
+            table = self._cache_table(df[cols])
+            tmp = self._tmp_path(self.cache_file)
+            feather.write_feather(table, tmp, compression="uncompressed")
+            os.replace(tmp, self.cache_file)
 
             # Save plot + column state into config.json
             plot_state = {
                 "col_states": col_states or {},
-                "xlim": list(self.ax.get_xlim()) if self.ax else None,
-                "ylim": list(self.ax.get_ylim()) if self.ax else None,
+                **view,
                 "time_range": {"earliest": earliest_iso, "latest": latest_iso},
-                "format": fmt,
+                "format": "feather",
             }
 
             import config_manager
-            cfg = config_manager.load_config()
-            cfg["plot_state"] = plot_state
-            config_manager.save_config(cfg)
+            config_manager.update_config(plot_state=plot_state)
 
             return True
         except Exception as e:
             print(f"[Cache] Failed to save: {e}")
             return False
 
+    @staticmethod
+    def time_range(df):
+        """(earliest, latest) updated_at as ISO strings, or (None, None); one int64 min/max pass."""
+        if df is None or df.empty or "updated_at" not in df.columns:
+            return None, None
+        ts = df["updated_at"]
+        if not pd.api.types.is_datetime64_any_dtype(ts):
+            ts = pd.to_datetime(ts, errors="coerce", cache=True)
+        ns = ts.to_numpy(dtype="datetime64[ns]").view("i8")
+        ns = ns[ns != np.iinfo(np.int64).min]  # NaT
+        if not ns.size:
+            return None, None
+        tz = getattr(ts.dtype, "tz", None)
+        return (pd.Timestamp(int(ns.min()), tz=tz).isoformat(),
+                pd.Timestamp(int(ns.max()), tz=tz).isoformat())
+
+    @staticmethod
+    def _cache_table(df):
+        """
+        Arrow table for the cache file. Values keep their pandas types (the
+        table and CSV export read them back); only device_name is narrowed,
+        dictionary-encoded since a handful of distinct names repeat on every row.
+        """
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        i = table.schema.get_field_index("device_name")
+        if i >= 0 and (pa.types.is_string(table.schema[i].type) or pa.types.is_large_string(table.schema[i].type)):
+            table = table.set_column(i, "device_name", table.column(i).dictionary_encode())
+        return table
+
+    @staticmethod
+    def _decode_dictionaries(table):
+        """Cast dictionary columns back to their values so pandas sees plain strings, not Categoricals."""
+        import pyarrow as pa
+
+        for i, field in enumerate(table.schema):
+            if pa.types.is_dictionary(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(field.type.value_type))
+        return table
+
+    @staticmethod
+    def _tmp_path(path):
+        root, ext = os.path.splitext(path)
+        return f"{root}.tmp{ext}"
+
+    @staticmethod
+    def _cache_format(path):
+        ext = os.path.splitext(path)[1].lower()
+        return "feather" if ext in (".arrow", ".feather") else "parquet"
+
     def load_cache(self):
-        if os.path.exists(self.cache_file):
+        path = self.cache_path()
+        if path is not None:
             try:
-                df = pd.read_parquet(self.cache_file)
+                fmt = self._cache_format(path)
+                if fmt == "feather":
+                    from pyarrow import feather
+                    # No memory map: a frame backed by the mapping would keep the file
+                    # open, and on Windows the next save's os.replace would fail
+                    table = feather.read_table(path, memory_map=False)
+                    df = self._decode_dictionaries(table).to_pandas()
+                else:
+                    # Pre-Feather cache from an older version
+                    df = pd.read_parquet(path)
                 return df
             except Exception as e:
                 print(f"[Cache] Failed to load: {e}")
         return None
 
+    def cache_path(self):
+        """The cache file to load: the Feather cache, else an older parquet one, else None."""
+        for path in (self.cache_file, self.legacy_cache_file):
+            if os.path.exists(path):
+                return path
+        return None
+
     # -------------------------------
     # Tooltip + Crosshair (fast nearest)
     # -------------------------------
     def _on_mouse_motion(self, event):
         if getattr(self, "_is_panning", False):
             self._on_mouse_drag(event)
+        elif self._rubber is not None:
+            self._on_rubber_drag(event)
         else:
             self._on_mouse_move(event)
 
@@ -263,109 +543,196 @@ class PlotManager:
             return
         if getattr(self, "_tooltip_mode", "cursor") == "legend":
             return  # don’t draw cursor tooltips if docked
-        if event.inaxes != self.ax or event.xdata is None or self.current_df.empty:
+        if event.inaxes != self.ax or event.xdata is None:
             return
 
-        # Fast nearest: binary search in sorted _x_np
-        try:
-            if len(self._x_np) == 0:
-                return
-
-            mouse_dt_py = mdates.num2date(event.xdata).replace(tzinfo=None)
-            mouse_ns = np.datetime64(mouse_dt_py, "ns")
+        # Coalesce to ~30 FPS: keep only the newest event and replay it when the frame is due
+        now = time.monotonic()
+        wait = MOTION_INTERVAL - (now - self._last_motion_ts)
+        if wait > 0:
+            if self._pending_motion is None:
+                if self._motion_timer is None:
+                    self._motion_timer = self.canvas.new_timer()
+                    self._motion_timer.single_shot = True
+                    self._motion_timer.add_callback(self._flush_motion)
+                self._motion_timer.interval = max(int(wait * 1000), 1)
+                self._motion_timer.start()
+            self._pending_motion = event
+            return
+        self._last_motion_ts = now
 
-            if mouse_ns < self._x_np[0] or mouse_ns > self._x_np[-1]:
-                # Outside data range → fabricate a "zero row"
-                row = {col: 0 for col in self.current_columns}
-                row["updated_at"] = mouse_dt_py
-            else:
-                # Normal nearest neighbor logic
-                idx = int(np.searchsorted(self._x_np, mouse_ns))
-                if idx <= 0:
-                    nearest = 0
-                elif idx >= len(self._x_np):
-                    nearest = len(self._x_np) - 1
-                else:
-                    prev_diff = abs(self._x_np[idx - 1] - mouse_ns)
-                    next_diff = abs(self._x_np[idx] - mouse_ns)
-                    nearest = idx - 1 if prev_diff <= next_diff else idx
-                row = self.current_df.iloc[nearest]
-        except Exception:
+        # Sub-2px jitter → nothing visible would change
+        lx, ly = self._last_px
+        if lx is not None and abs(event.x - lx) < 2 and abs(event.y - ly) < 2:
             return
+        self._last_px = (event.x, event.y)
 
-        # Clean up old tooltip annotations
-        if hasattr(self, "_tooltip_items"):
-            for item in self._tooltip_items:
-                try:
-                    item.remove()
-                except Exception:
-                    pass
-        self._tooltip_items = []
+        # Fast nearest: event.xdata is already a date float → search _x_md directly
+        ts = self._ts_ns
+        if ts is None:
+            return
+        xs = self._x_md
+        mx = event.xdata
+
+        if mx < xs[0] or mx > xs[-1]:
+            # Outside data range → fabricate a "zero row"
+            vals = {col: 0.0 for col in self.current_columns}
+            row = {}
+            row["updated_at"] = _num_to_ns(mx)
+            self._last_snap_idx = -1
+        else:
+            # Normal nearest neighbor logic: in range, so only i-1 / i can win.
+            # Clamp once, then pick with a bool (0/1) on plain floats — no branches.
+            # (A single-row dataset yields -1, which still indexes that row.)
+            i = min(max(self._search_x(mx), 1), len(xs) - 1)
+            left, right = float(xs[i - 1]), float(xs[i])
+            nearest = i - ((mx - left) <= (right - mx))
+            if nearest == self._last_snap_idx and self._tooltip_box is not None \
+                    and self._tooltip_box.get_visible():
+                # Same row as before → just move the existing tooltip + crosshair
+                self._move_tooltip(event.xdata, event.ydata)
+                return
+            self._last_snap_idx = nearest
+            vals = {col: self._cols[col][nearest] for col in self.current_columns if col in self._cols}
+            row = {}
+            for col, arr in self._col_arrays.items():
+                row[col] = arr[nearest]
+            row["updated_at"] = ts[nearest]
 
         # First line = timestamp (white)
-        lines = [row["updated_at"].strftime("%Y-%m-%d %H:%M:%S")]
+        lines = [_ts_label(row["updated_at"])]
         colors = ["white"]
 
         if "device_name" in row and pd.notna(row["device_name"]):
             lines.append(f"Device: {row['device_name']}")
             colors.append("white")  # or "white" if you want consistent
 
-        # Add metric values with their line colors
-        for col in self.current_columns:
-            if col in row and pd.notna(row[col]):
-                try:
-                    val_str = f"{float(row[col]):.2f} : {col}"
-                except Exception:
-                    val_str = f"{row[col]} : {col}"
-                lines.append(val_str)
+        # Add metric values with their line colors (already floats; v == v skips NaN)
+        suffix = self._col_suffix
+        for col, v in vals.items():
+            if v == v:
+                lines.append(f"{v:.2f}{suffix[col]}")
                 colors.append(self.line_colors.get(col, "white"))
 
         if not lines:
             return
+        lines, colors = lines[:MAX_TOOLTIP_LINES], colors[:MAX_TOOLTIP_LINES]
+
+        # Update pooled artists in place (no create/remove per move)
+        self._ensure_tooltip_artists(event.xdata, event.ydata)
+
+        # One colored row per line; hidden rows are skipped by the packer
+        for i, row_area in enumerate(self._tooltip_rows):
+            if i < len(lines):
+                row_area.set_text(lines[i])
+                row_area.get_children()[0].set_color(colors[i])
+                row_area.set_visible(True)
+            else:
+                row_area.set_visible(False)
+        self._tooltip_box.set_visible(True)
+
+        self.vline.set_visible(True)
+        self._move_tooltip(event.xdata, event.ydata)
+
+    def _search_x(self, mx):
+        """np.searchsorted(_x_md, mx) (left side); O(1) on uniformly sampled data."""
+        xs = self._x_md
+        if self._inv_dt is None:
+            return int(np.searchsorted(xs, mx))
+        # Guess from the step, then walk the few slots jitter can be off by
+        n = len(xs)
+        i = min(max(int((mx - xs[0]) * self._inv_dt), 0), n)
+        while i > 0 and xs[i - 1] >= mx:
+            i -= 1
+        while i < n and xs[i] < mx:
+            i += 1
+        return i
+
+    def _flush_motion(self):
+        event, self._pending_motion = self._pending_motion, None
+        if event is not None:
+            self._on_mouse_move(event)
+
+    def _move_tooltip(self, x, y):
+        """Re-anchor the tooltip and crosshair at (x, y) and blit."""
+        self._tooltip_box.xy = (x, y)
+        self.vline.set_xdata([x, x])
+        self._blit_tooltip()
 
-        # Background box (no visible text, just black rounded pad)
-        bg = self.ax.annotate(
-            "\n".join(lines),
-            xy=(event.xdata, event.ydata),
-            xytext=(30, 10),
-            textcoords="offset points",
-            fontsize=9,
-            color="none",
-            va="top", ha="left",
-            bbox=dict(boxstyle="round,pad=0.8", fc="black", alpha=0.85),
-            zorder=200,
+    def _ensure_tooltip_artists(self, x, y):
+        """Create the crosshair + tooltip artists once; they are animated and blitted."""
+        if self._tooltip_box is not None:
+            return
+        self._tooltip_rows = [
+            TextArea("", textprops=dict(fontsize=9, color="white"))
+            for _ in range(MAX_TOOLTIP_LINES)
+        ]
+        self._tooltip_box = AnnotationBbox(
+            VPacker(children=self._tooltip_rows, align="left", pad=0, sep=3),
+            (x, y),
+            xybox=(30, 10),
+            boxcoords="offset points",
+            box_alignment=(0, 1),
+            bboxprops=dict(boxstyle="round,pad=0.8", fc="black", ec="none", alpha=0.85),
+            zorder=200, animated=True, visible=False,
         )
-        self._tooltip_items.append(bg)
-
-        # Overlay each line with its color
-        line_height = 12
-        y_offset_start = 12
-        for i, (text, c) in enumerate(zip(lines, colors)):
-            t = self.ax.annotate(
-                text,
-                xy=(event.xdata, event.ydata),
-                xytext=(34, y_offset_start - i * line_height),
-                textcoords="offset points",
-                fontsize=9,
-                color=c,
-                va="top", ha="left",
-                zorder=201,
-            )
-            self._tooltip_items.append(t)
+        self.ax.add_artist(self._tooltip_box)
+        self.vline = self.ax.axvline(x, color="gray", linestyle="--", animated=True, visible=False)
 
-        # Vertical crosshair
-        if self.vline is None:
-            self.vline = self.ax.axvline(event.xdata, color="gray", linestyle="--")
-        else:
-            self.vline.set_xdata([event.xdata, event.xdata])
+    def _reset_tooltip_artists(self):
+        """Forget pooled artists after ax.clear() (they were removed with the axes contents)."""
+        self.vline = None
+        self._tooltip_box = None
+        self._tooltip_rows = []
+        self._blit_bg = None
+        self._last_snap_idx = -1
+
+    def _tooltip_artists(self):
+        arts = [self._tooltip_box, self.vline]
+        return [a for a in arts if a is not None and a.get_visible()]
+
+    def _on_draw(self, event):
+        # Full redraw finished → grab a clean background, then put the tooltip back on top
+        if self.canvas is None:
+            return
+        self._blit_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        for art in self._tooltip_artists():
+            self.fig.draw_artist(art)
 
-        self.canvas.draw_idle()
+    def _invalidate_blit_bg(self, ax=None):
+        self._blit_bg = None
+
+    def _blit_tooltip(self):
+        """Repaint only the tooltip/crosshair over the cached background."""
+        if self.canvas is None:
+            return
+        if self._blit_bg is None:
+            self.canvas.draw_idle()  # draw_event will capture the background
+            return
+        self.canvas.restore_region(self._blit_bg)
+        for art in self._tooltip_artists():
+            self.fig.draw_artist(art)
+        self.canvas.blit(self.fig.bbox)
+
+    def _hide_tooltip(self):
+        self._pending_motion = None  # a deferred move must not re-show it
+        self._last_snap_idx = -1
+        self._last_px = (None, None)
+        arts = self._tooltip_artists()
+        for art in arts:
+            art.set_visible(False)
+        if arts:
+            self._blit_tooltip()
 
     # -------------------------------
     # Legend (visible-only)
     # -------------------------------
     def _draw_fixed_legend(self):
-        vis_lines = [ln for ln in self.ax.get_lines() if ln.get_visible()]
+        vis_lines = [ln for ln in self.ax.get_lines() if ln.get_visible() and ln is not self.vline]
+        keys = tuple(ln.get_label() for ln in vis_lines)
+        if keys == self._legend_keys and (not keys or self.ax.get_legend() is not None):
+            return  # same set of lines → keep the existing legend
+        self._legend_keys = keys
         if vis_lines:
             labels = [ln.get_label() for ln in vis_lines]
             self.ax.legend(
@@ -384,53 +751,140 @@ class PlotManager:
     # Panning
     # -------------------------------
     def _on_mouse_press(self, event):
+        if event.button == 1 and event.inaxes == self.ax and not self.canvas.widgetlock.locked():
+            self._start_rubber(event)  # toolbar pan/zoom modes hold the widgetlock
+            return
         if event.button == 3 and event.inaxes == self.ax:
             self._is_panning = True
             self._pan_start_px = (event.x, event.y)
             self._orig_xlim = self.ax.get_xlim()
             self._orig_ylim = self.ax.get_ylim()
+            # Data units per pixel at press; linear axes, so drag offsets are just px * scale
+            bbox = self.ax.bbox
+            self._pan_scale = ((self._orig_xlim[1] - self._orig_xlim[0]) / bbox.width,
+                               (self._orig_ylim[1] - self._orig_ylim[0]) / bbox.height)
+
+            # Render once without lines/tooltip, then only the lines are blitted while dragging
+            for art in self._tooltip_artists():
+                art.set_visible(False)
+            for line in self.lines.values():
+                line.set_animated(True)
+                line.set_antialiased(False)  # pan preview only
+            self.canvas.draw()
+            self._drag_bg = self.canvas.copy_from_bbox(self.fig.bbox)
 
     def _on_mouse_release(self, event):
+        if event.button == 1 and self._rubber is not None:
+            self._finish_rubber(event)
+            return
         if event.button == 3:
+            if self._pan_px is not None:
+                self._pan_timer.stop()
+                self._flush_pan()  # land exactly where the mouse was released
             self._is_panning = False
+            if self._drag_bg is not None:
+                self._drag_bg = None
+                for line in self.lines.values():
+                    line.set_animated(False)
+                    line.set_antialiased(True)
+                self.canvas.draw_idle()  # one real draw: ticks/labels catch up
 
     def _on_figure_leave(self, event):
-        # Clear tooltip items
-        if hasattr(self, "_tooltip_items"):
-            for item in self._tooltip_items:
-                try:
-                    item.remove()
-                except Exception:
-                    pass
-            self._tooltip_items = []
-
-        # Remove crosshair if present
-        if self.vline is not None:
-            try:
-                self.vline.remove()
-            except Exception:
-                pass
-            self.vline = None
-
-        if self.canvas:
-            self.canvas.draw_idle()
+        # Hide tooltip + crosshair (pooled artists stay alive)
+        self._hide_tooltip()
 
     def _on_mouse_drag(self, event):
+        """Remember the newest drag position; limits are applied at most once per ~16 ms frame."""
         if not getattr(self, "_is_panning", False) or event.inaxes != self.ax:
             return
-        dx_px = event.x - self._pan_start_px[0]
-        dy_px = event.y - self._pan_start_px[1]
-        inv = self.ax.transData.inverted()
-        x0, y0 = inv.transform((0, 0))
-        x1, y1 = inv.transform((dx_px, dy_px))
-        dx_data, dy_data = x1 - x0, y1 - y0
+        pending = self._pan_px is not None
+        self._pan_px = (event.x, event.y)
+        if pending:
+            return
+        if self._pan_timer is None:
+            self._pan_timer = self.canvas.new_timer(interval=16)
+            self._pan_timer.single_shot = True
+            self._pan_timer.add_callback(self._flush_pan)
+        self._pan_timer.start()
+
+    def _flush_pan(self):
+        """Apply the latest pan offset (relative to the press) and blit the lines."""
+        px, self._pan_px = self._pan_px, None
+        if px is None or not getattr(self, "_is_panning", False):
+            return
+        dx_data = (px[0] - self._pan_start_px[0]) * self._pan_scale[0]
+        dy_data = (px[1] - self._pan_start_px[1]) * self._pan_scale[1]
         self.ax.set_xlim(self._orig_xlim[0] - dx_data, self._orig_xlim[1] - dx_data)
         self.ax.set_ylim(self._orig_ylim[0] - dy_data, self._orig_ylim[1] - dy_data)
+        if self._drag_bg is None:
+            self.canvas.draw_idle()
+            return
+        self._blit_lines()
+
+    def _blit_lines(self):
+        """Redraw just the (animated) lines over the background captured at pan start."""
+        self.canvas.restore_region(self._drag_bg)
+        with plt.rc_context(PLOT_RC):
+            for line in self.lines.values():
+                self.ax.draw_artist(line)
+        self.canvas.blit(self.fig.bbox)
+
+    def _request_draw(self):
+        """Coalesce bursts of pan/zoom/key events into at most one redraw per ~16 ms frame."""
+        if self._draw_pending:
+            return
+        if self._draw_timer is None:
+            self._draw_timer = self.canvas.new_timer(interval=16)
+            self._draw_timer.single_shot = True
+            self._draw_timer.add_callback(self._flush_draw)
+        self._draw_pending = True
+        self._draw_timer.start()
+
+    def _flush_draw(self):
+        self._draw_pending = False
         self.canvas.draw_idle()
 
     # -------------------------------
     # Zoom & Keys
     # -------------------------------
+    def _start_rubber(self, event):
+        """Begin a zoom rectangle; only the patch is blitted while dragging."""
+        self._hide_tooltip()
+        if self._blit_bg is None:
+            self.canvas.draw()  # draw_event captures the background
+        self._rubber_press = event
+        self._rubber_inv = self.ax.transData.inverted()
+        self._rubber = Rectangle((event.xdata, event.ydata), 0, 0, fill=False,
+                                 ec="black", lw=1, ls="--", animated=True)
+        self.ax.add_patch(self._rubber)
+
+    def _rubber_xy(self, event):
+        """Event position in data coords, clipped to the axes (also outside of them)."""
+        x, y = self._rubber_inv.transform((event.x, event.y))
+        (x0, x1), (y0, y1) = sorted(self.ax.get_xlim()), sorted(self.ax.get_ylim())
+        return min(max(x, x0), x1), min(max(y, y0), y1)
+
+    def _on_rubber_drag(self, event):
+        x, y = self._rubber_xy(event)
+        px, py = self._rubber_press.xdata, self._rubber_press.ydata
+        self._rubber.set_bounds(min(px, x), min(py, y), abs(x - px), abs(y - py))
+        if self._blit_bg is not None:
+            self.canvas.restore_region(self._blit_bg)
+            self.ax.draw_artist(self._rubber)
+            self.canvas.blit(self.fig.bbox)
+
+    def _finish_rubber(self, event):
+        press, self._rubber_press = self._rubber_press, None
+        self._rubber.remove()
+        self._rubber = None
+        if self._blit_bg is not None:
+            self.canvas.restore_region(self._blit_bg)
+            self.canvas.blit(self.fig.bbox)
+        if abs(event.x - press.x) < 3 and abs(event.y - press.y) < 3:
+            return  # a click, not a drag
+        event.xdata, event.ydata = self._rubber_xy(event)
+        self._on_select(press, event)
+
     def _on_select(self, eclick, erelease):
         if eclick.xdata is None or erelease.xdata is None:
             return
@@ -458,7 +912,7 @@ class PlotManager:
         new_ylim = [ydata - (ydata - ylim[0]) * scale, ydata + (ylim[1] - ydata) * scale]
         self.ax.set_xlim(new_xlim)
         self.ax.set_ylim(new_ylim)
-        self.canvas.draw_idle()
+        self._request_draw()
 
     def _on_key(self, event):
         key = event.key.lower() if event.key else ""
@@ -469,17 +923,7 @@ class PlotManager:
             print(f"[PlotManager] Tooltip {'enabled' if self.tooltip_enabled else 'disabled'}")
 
             if not self.tooltip_enabled:
-                if hasattr(self, "_tooltip_items"):
-                    for item in self._tooltip_items:
-                        try:
-                            item.remove()
-                        except Exception:
-                            pass
-                    self._tooltip_items = []
-                if self.vline is not None:
-                    self.vline.remove()
-                    self.vline = None
-                self.canvas.draw_idle()
+                self._hide_tooltip()
             return
 
         # Reset view
@@ -488,20 +932,20 @@ class PlotManager:
             return
 
         # Arrow keys navigation
-        xlim = self.ax.get_xlim()
-        x0, x1 = mdates.num2date(xlim[0]), mdates.num2date(xlim[1])
-        delta = timedelta(minutes=1)
+        # xlim is already in matplotlib float days → shift it directly
+        step = 1 / 1440                          # 1 minute
         if key.startswith("shift"):
-            delta = timedelta(hours=1)
+            step = 1 / 24
         if key.startswith("ctrl"):
-            delta = timedelta(days=1)
+            step = 1.0
 
+        x0, x1 = self.ax.get_xlim()
         if key.endswith("left"):
-            self.ax.set_xlim(x0 - delta, x1 - delta)
+            self.ax.set_xlim(x0 - step, x1 - step)
         elif key.endswith("right"):
-            self.ax.set_xlim(x0 + delta, x1 + delta)
+            self.ax.set_xlim(x0 + step, x1 + step)
 
-        self.canvas.draw_idle()
+        self._request_draw()
 
         if self.on_key_hook:
             self.on_key_hook(event)
@@ -510,28 +954,39 @@ class PlotManager:
     # Reset view
     # -------------------------------
     def reset_view(self):
-        """Reset plot to show the full extent of the currently loaded dataset."""
-        if self.current_df is None or self.current_df.empty:
+        """
+        Reset plot to the home view: the window set by set_time_window or
+        restored from the cache, else the full extent of the loaded dataset.
+        """
+        if self._ts_ns is None or len(self._ts_ns) == 0:
             print("[PlotManager] No data loaded, cannot reset view.")
             return
 
         try:
-            start = self.current_df["updated_at"].min()
-            end = self.current_df["updated_at"].max()
-            if start is None or end is None:
-                print("[PlotManager] No valid updated_at values.")
-                return
+            # _x_md is sorted and NaT-free, so the ends are the extent
+            x0, x1 = self.home_xlim if self.home_xlim is not None else (self._x_md[0], self._x_md[-1])
+            start, end = _ts_label(_num_to_ns(x0)), _ts_label(_num_to_ns(x1))
 
             # Reset x-limits
-            self.ax.set_xlim(start, end)
+            self.ax.set_xlim(x0, x1)
             self.home_xlim = self.ax.get_xlim()
 
-            # Rescale y based on visible data
-            self.ax.relim(visible_only=True)
-            self.ax.autoscale(axis="y", tight=False)
+            # Rescale y straight from the visible rows of the visible columns (no relim pass)
+            lo, hi = self._view_slice()
+            ys = [self._cols[c][lo:hi] for c, ln in self.lines.items()
+                  if ln.get_visible() and c in self._cols and hi > lo]
+            ymin = min((np.fmin.reduce(y) for y in ys), default=np.nan)
+            ymax = max((np.fmax.reduce(y) for y in ys), default=np.nan)
+            if np.isfinite(ymin) and np.isfinite(ymax):
+                pad = (ymax - ymin) * self.ax.margins()[1] or 1.0
+                self.ax.set_ylim(float(ymin) - pad, float(ymax) + pad)
+                self.ax.set_autoscaley_on(True)  # newly added lines still autoscale y
+            else:
+                self.ax.relim(visible_only=True)
+                self.ax.autoscale(axis="y", tight=False)
 
             self.canvas.draw_idle()
-            print(f"[PlotManager] 🔄 Reset view to full range: {start} → {end}")
+            print(f"[PlotManager] 🔄 Reset view to home range: {start} → {end}")
         except Exception as e:
             print(f"[PlotManager] ❌ Reset view failed: {e}")
 
@@ -541,7 +996,7 @@ class PlotManager:
             return
         if end_la <= start_la:
             return
-        self.ax.set_xlim(start_la, end_la)
+        self.ax.set_xlim(_to_num(start_la), _to_num(end_la))
         # make this the "home" view for Esc / 'r'
         self.home_xlim = self.ax.get_xlim()
         if self.canvas:
@@ -559,35 +1014,33 @@ class PlotManager:
         if df.empty or "updated_at" not in df.columns:
             return df
 
-        df = df.sort_values("updated_at").copy()
+        # Sorting copies the whole frame; query/cache data normally arrives sorted already
+        if not df["updated_at"].is_monotonic_increasing:
+            df = df.sort_values("updated_at")
         gap_threshold = pd.Timedelta(threshold)
 
-        # Find indices where the gap is larger than threshold
-        gaps = df["updated_at"].diff() > gap_threshold
-        rows_to_insert = []
-
-        for i in df[gaps].index:
-            ts = df.loc[i, "updated_at"]
-
-            # Build a dict of correct dtypes → NaN or NaT
-            nan_row = {}
-            for col in df.columns:
-                if pd.api.types.is_datetime64_any_dtype(df[col]):
-                    nan_row[col] = pd.NaT
-                elif pd.api.types.is_numeric_dtype(df[col]):
-                    nan_row[col] = np.nan
-                else:
-                    nan_row[col] = None
-            nan_row["updated_at"] = ts - pd.Timedelta(seconds=1)
-
-            rows_to_insert.append(nan_row)
-
-        if rows_to_insert:
-            filler = pd.DataFrame(rows_to_insert).astype(df.dtypes.to_dict(), errors="ignore")
-            df = pd.concat([df, filler], ignore_index=True)
-            df = df.sort_values("updated_at")
+        # Rows that start after a gap larger than threshold (one scan over the int64 view)
+        gaps = gap_indices(df["updated_at"].to_numpy(dtype="datetime64[ns]").view("i8"), gap_threshold.value)
+        n_gaps = len(gaps)
+        if not n_gaps:
+            return df
 
-        return df
+        # One filler frame for all gaps: NaN for numerics, the dtype's own NA (NaT/None) otherwise.
+        # Dispatch is once per column (from df.dtypes), never per gap.
+        def blank(dtype):
+            if pd.api.types.is_numeric_dtype(dtype):
+                return np.full(n_gaps, np.nan)
+            if dtype == object:
+                return np.full(n_gaps, None, dtype=object)
+            return pd.Series(None, index=range(n_gaps), dtype=dtype)
+
+        filler = pd.DataFrame({col: blank(dtype) for col, dtype in df.dtypes.items()})
+        filler["updated_at"] = (df["updated_at"].iloc[gaps] - pd.Timedelta(seconds=1)).array
+
+        # df is sorted and filler i belongs right before row gaps[i]: splice by position, no re-sort
+        n = len(df)
+        order = np.insert(np.arange(n), gaps, np.arange(n, n + n_gaps))
+        return pd.concat([df, filler], ignore_index=True).take(order)
 
 
     def load_col_states(self):
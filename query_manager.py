@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytz
 from sqlalchemy import text
@@ -137,9 +138,14 @@ class QueryManager:
                 LIMIT 60000;
             """)
 
+        # Stream typed chunks off the server-side cursor instead of one big list of Row
+        # tuples; updated_at is parsed per chunk as it arrives
         with self.engine.connect().execution_options(stream_results=True) as conn:
-            result = conn.execute(query, params)
-            df = pd.DataFrame(result.fetchall(), columns=result.keys())
+            chunks = list(pd.read_sql(query, conn, params=params,
+                                      parse_dates=["updated_at"], chunksize=8192))
+        df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+        # A column that is all NULL in some chunk comes back object there; re-infer once
+        df = df.infer_objects()
 
         # --- Normalize ---
         if df.empty:
@@ -187,12 +193,16 @@ class QueryManager:
             df["fan_tach_rpm"] = df["fan_tach_rpm"] / 100.0
 
         temp_cols = [c for c in df.columns if c.endswith("_temp_c")]
-        if self.units == "f":
-            for col in temp_cols:
-                new_col = col.replace("_temp_c", "_temp_f")
-                df[new_col] = (df[col] * 9.0 / 5.0 + 32.0).round(3)
-            if temp_cols:
-                df.drop(columns=temp_cols, inplace=True)
+        if self.units == "f" and temp_cols:
+            # One in-place pass over the whole temperature block
+            block = df[temp_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            np.multiply(block, 1.8, out=block)
+            np.add(block, 32.0, out=block)
+            np.round(block, 3, out=block)
+            df = df.drop(columns=temp_cols).assign(**{
+                col.replace("_temp_c", "_temp_f"): block[:, i]
+                for i, col in enumerate(temp_cols)
+            })
 
         return df
 
@@ -102,7 +102,7 @@ class UserSearchWindow:
         try:
             # update parent config with latest dropdown selection
             self.app.config["search_mode"] = self.search_mode.get()
-            config_manager.save_config(self.app.config)
+            config_manager.update_config(search_mode=self.app.config["search_mode"])
         except Exception as e:
             self.logger(f"[UserSearch] Failed to save search_mode: {e}")
         finally: